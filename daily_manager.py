@@ -2,70 +2,182 @@
 Gestionnaire de persistence quotidienne - Organisation par date de publication
 """
 
-import json
+import atexit
+import heapq
+import mmap
+import os
+import threading
+from collections import defaultdict
 from datetime import datetime
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
+from json_utils import json_dumps, json_loads, write_atomic
 from youtube_processor import get_video_id_from_url
 
+# Au-delà de cette taille, videos_processed.json est lu via mmap (pas de copie)
+MMAP_THRESHOLD = 1 << 20
 
+# Nombre de jours affichés par --status-daily
+STATUS_DAYS = 10
+
+
+@lru_cache(maxsize=None)
 def create_daily_directory(date):
     """Créer le répertoire daily pour une date donnée"""
-    date_str = date.strftime("%Y-%m-%d")
+    date_str = f"{date.year:04d}-{date.month:02d}-{date.day:02d}"
     daily_dir = Path("daily") / date_str
     daily_dir.mkdir(parents=True, exist_ok=True)
     return daily_dir
 
 
-def get_processed_videos(daily_dir):
-    """Récupérer la liste des vidéos déjà traitées pour une date"""
-    processed_file = daily_dir / "videos_processed.json"
-
-    if processed_file.exists():
+def _read_processed_file(processed_file):
+    """Lire videos_processed.json (mmap au-delà de MMAP_THRESHOLD)"""
+    with open(processed_file, "rb") as f:
+        if os.fstat(f.fileno()).st_size > MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    return json_loads(view)
+        return json_loads(f.read())
+
+
+class DailyStateCache:
+    """
+    État en mémoire des videos_processed.json pendant une exécution
+
+    Chaque fichier est lu une fois au premier accès ; les ajouts restent en
+    mémoire et sont écrits par flush() (fin de topic, ou à la sortie du
+    programme), après fusion avec le contenu actuel du fichier.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()  # Topics traités en parallèle
+        self._data = {}  # daily_dir -> {"video_ids": [...], "videos": [...]}
+        self._ids = {}  # daily_dir -> set des video_ids
+        self._dirty = set()
+
+    def _load_locked(self, daily_dir):
+        if daily_dir not in self._data:
+            processed_data = {"video_ids": [], "videos": []}
+            processed_file = daily_dir / "videos_processed.json"
+            if processed_file.exists():
+                try:
+                    processed_data = _read_processed_file(processed_file)
+                except Exception as e:
+                    print(f"⚠️ Erreur lecture videos_processed.json : {e}")
+            self._data[daily_dir] = processed_data
+            self._ids[daily_dir] = set(processed_data.get("video_ids", []))
+        return self._data[daily_dir]
+
+    def _merge_disk_locked(self, daily_dir):
+        """Reprendre les vidéos écrites sur disque par un autre run depuis la lecture"""
+        processed_file = daily_dir / "videos_processed.json"
+        if not processed_file.exists():
+            return
         try:
-            with open(processed_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                return set(data.get("video_ids", []))
+            on_disk = _read_processed_file(processed_file)
         except Exception as e:
             print(f"⚠️ Erreur lecture videos_processed.json : {e}")
+            return
+
+        processed_data = self._data[daily_dir]
+        known_ids = self._ids[daily_dir]
+        disk_videos = {
+            video.get("video_id"): video for video in on_disk.get("videos", [])
+        }
+        for video_id in on_disk.get("video_ids", []):
+            if video_id in known_ids:
+                continue
+            known_ids.add(video_id)
+            processed_data.setdefault("video_ids", []).append(video_id)
+            if video_id in disk_videos:
+                processed_data.setdefault("videos", []).append(disk_videos[video_id])
+
+    def load(self, daily_dir):
+        """Charger (une seule fois) l'état d'un répertoire daily"""
+        with self._lock:
+            return self._load_locked(daily_dir)
+
+    def processed_ids(self, daily_dir):
+        """Copie des video_ids déjà traités pour un répertoire daily"""
+        with self._lock:
+            self._load_locked(daily_dir)
+            # Copie prise sous verrou : l'appelant ne voit pas les ajouts suivants
+            return set(self._ids[daily_dir])
+
+    def add(self, daily_dir, video, processed_at=None):
+        """Marquer une vidéo comme traitée (en mémoire jusqu'au flush)"""
+        if processed_at is None:
+            processed_at = datetime.now().isoformat()
+        video_id = video.video_id or get_video_id_from_url(video.url)
+
+        with self._lock:
+            processed_data = self._load_locked(daily_dir)
+            known_ids = self._ids[daily_dir]
+            if video_id in known_ids:
+                return
+
+            known_ids.add(video_id)
+            processed_data.setdefault("video_ids", []).append(video_id)
+            processed_data.setdefault("videos", []).append(
+                {
+                    "video_id": video_id,
+                    "title": video.title,
+                    "url": video.url,
+                    "channel": video.channel,
+                    "published": video.published,
+                    "processed_at": processed_at,
+                }
+            )
+            self._dirty.add(daily_dir)
+
+    def flush(self):
+        """Écrire les répertoires daily modifiés (une écriture par date)"""
+        with self._lock:
+            for daily_dir in sorted(self._dirty):
+                # Relecture juste avant l'écriture : un autre run (ex. deux --topic
+                # en parallèle sur la même date) a pu ajouter des vidéos entre-temps
+                self._merge_disk_locked(daily_dir)
+                processed_data = self._data[daily_dir]
+                try:
+                    write_atomic(
+                        daily_dir / "videos_processed.json", json_dumps(processed_data)
+                    )
+                    # Résumé minuscule lu par --status-daily (évite de décoder le JSON)
+                    write_atomic(
+                        daily_dir / "summary.json",
+                        json_dumps({"count": len(processed_data["video_ids"])}),
+                    )
+                except Exception as e:
+                    print(f"❌ Erreur sauvegarde video processée : {e}")
+            self._dirty.clear()
+
+
+# Instance partagée par tout le processus, vidée aussi à la sortie
+daily_state = DailyStateCache()
+atexit.register(daily_state.flush)
 
-    return set()
+
+def get_processed_videos(daily_dir):
+    """Récupérer la liste des vidéos déjà traitées pour une date"""
+    return daily_state.processed_ids(daily_dir)
 
 
 def save_processed_video(daily_dir, video):
     """Sauvegarder une vidéo comme traitée dans son répertoire daily"""
-    processed_file = daily_dir / "videos_processed.json"
+    save_processed_videos_bulk(daily_dir, [video])
 
-    # Charger les vidéos déjà traitées
-    processed_data = {"video_ids": [], "videos": []}
-    if processed_file.exists():
-        try:
-            with open(processed_file, "r", encoding="utf-8") as f:
-                processed_data = json.load(f)
-        except Exception:
-            pass
-
-    # Ajouter la nouvelle vidéo si pas déjà présente
-    video_id = get_video_id_from_url(video["url"])
-
-    if video_id not in processed_data["video_ids"]:
-        processed_data["video_ids"].append(video_id)
-        processed_data["videos"].append(
-            {
-                "video_id": video_id,
-                "title": video["title"],
-                "url": video["url"],
-                "channel": video["channel"],
-                "published": video["published"],
-                "processed_at": datetime.now().isoformat(),
-            }
-        )
 
-        # Sauvegarder
-        try:
-            with open(processed_file, "w", encoding="utf-8") as f:
-                json.dump(processed_data, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            print(f"❌ Erreur sauvegarde video processée : {e}")
+def save_processed_videos_bulk(daily_dir, videos):
+    """Sauvegarder plusieurs vidéos comme traitées (écrites au prochain flush)"""
+    processed_at = datetime.now().isoformat()  # Un seul horodatage par lot
+    for video in videos:
+        daily_state.add(daily_dir, video, processed_at)
+
+
+def flush_processed_videos():
+    """Écrire sur disque les vidéos marquées comme traitées"""
+    daily_state.flush()
 
 
 def filter_new_videos(videos, verbose=True):
@@ -73,27 +185,35 @@ def filter_new_videos(videos, verbose=True):
     new_videos = []
     new_videos_count = 0
 
-    for video in videos:
-        pub_date = video["published_date"].date()
+    # Premier passage : un répertoire et une lecture par date présente dans le lot
+    daily_dirs = {}
+    all_processed: set[str] = set()
+    for pub_date in {video.pub_date for video in videos}:
         daily_dir = create_daily_directory(pub_date)
+        daily_dirs[pub_date] = daily_dir
+        all_processed.update(get_processed_videos(daily_dir))
+
+    # Second passage : simple test d'appartenance par vidéo
+    for video in videos:
+        pub_date = video.pub_date
+        daily_dir = daily_dirs[pub_date]
 
         # Vérifier si déjà traitée
-        processed_videos = get_processed_videos(daily_dir)
-        video_id = get_video_id_from_url(video["url"])
+        video_id = video.video_id or get_video_id_from_url(video.url)
 
-        if video_id not in processed_videos:
-            video["daily_dir"] = daily_dir
-            video["video_id"] = video_id
+        if video_id not in all_processed:
+            video.daily_dir = daily_dir
+            video.video_id = video_id
             new_videos.append(video)
             new_videos_count += 1
 
             if verbose:
                 print(
-                    f"    🆕 Nouvelle vidéo pour {pub_date}: {video['title'][:50]}..."
+                    f"    🆕 Nouvelle vidéo pour {pub_date}: {video.title[:50]}..."
                 )
         else:
             if verbose:
-                print(f"    ⏭️  Déjà traitée ({pub_date}): {video['title'][:50]}...")
+                print(f"    ⏭️  Déjà traitée ({pub_date}): {video.title[:50]}...")
 
     if verbose:
         print(f"📈 Total : {new_videos_count} nouvelles vidéos à traiter")
@@ -102,28 +222,32 @@ def filter_new_videos(videos, verbose=True):
 
 
 def group_videos_by_date(videos):
-    """Grouper les vidéos par date de publication"""
-    videos_by_date = {}
+    """Grouper les vidéos par date de publication (plus récente en premier)"""
+    videos_by_date = defaultdict(list)
 
-    for video in videos:
-        pub_date = video["published_date"].date()
-        if pub_date not in videos_by_date:
-            videos_by_date[pub_date] = []
-        videos_by_date[pub_date].append(video)
+    # Tri unique (quasi linéaire : les vidéos arrivent déjà triées de la collecte),
+    # puis un seul passage : l'ordre d'insertion du dict donne les dates triées
+    for video in sorted(videos, key=attrgetter("published_ts"), reverse=True):
+        videos_by_date[video.pub_date].append(video)
+
+    return dict(videos_by_date)
 
-    return videos_by_date
 
+def save_synthesis_by_date(synthesis_content, topic_name, pub_date, daily_dir=None):
+    """Sauvegarder une synthèse dans le répertoire daily de sa date
 
-def save_synthesis_by_date(synthesis_content, topic_name, pub_date):
-    """Sauvegarder une synthèse dans le répertoire daily de sa date"""
-    daily_dir = create_daily_directory(pub_date)
+    daily_dir évite de repasser par create_daily_directory quand le répertoire
+    est déjà connu (filter_new_videos le stocke dans chaque vidéo).
+    """
+    if daily_dir is None:
+        daily_dir = create_daily_directory(pub_date)
     synthesis_file = (
         daily_dir / f"synthese_{topic_name.replace(' ', '_')}_{pub_date}.md"
     )
 
     try:
-        with open(synthesis_file, "w", encoding="utf-8") as f:
-            f.write(synthesis_content)
+        # Répertoire déjà créé (create_daily_directory est mémoïsé)
+        synthesis_file.write_text(synthesis_content, encoding="utf-8")
 
         print(f"✅ Synthèse {pub_date} sauvée : {synthesis_file}")
         return str(synthesis_file)
@@ -134,51 +258,104 @@ def save_synthesis_by_date(synthesis_content, topic_name, pub_date):
 
 def mark_videos_as_processed(date_videos):
     """Marquer toutes les vidéos d'une date comme traitées"""
+    videos_by_dir = {}
     for video in date_videos:
-        save_processed_video(video["daily_dir"], video)
+        videos_by_dir.setdefault(video.daily_dir, []).append(video)
+
+    for daily_dir, dir_videos in videos_by_dir.items():
+        save_processed_videos_bulk(daily_dir, dir_videos)
 
 
-def get_daily_status():
-    """Obtenir le statut de tous les répertoires daily"""
+def _count_processed_ids(processed_file):
+    """Compter les video_ids sans décoder le détail des vidéos"""
+    data = processed_file.read_bytes()
+
+    # Décoder uniquement le tableau "video_ids" (les IDs ne contiennent pas de "]")
+    key_pos = data.find(b'"video_ids"')
+    if key_pos >= 0:
+        start = data.find(b"[", key_pos)
+        end = data.find(b"]", start)
+        if start >= 0 and end >= 0:
+            try:
+                return len(json_loads(data[start : end + 1]))
+            except ValueError:
+                pass
+
+    # Format inattendu : décodage complet
+    return len(json_loads(data).get("video_ids", []))
+
+
+def get_daily_status(include_details=False):
+    """Obtenir le statut de tous les répertoires daily
+
+    Le détail des vidéos (clé "videos_details") n'est décodé que si
+    include_details est vrai ; sinon seul le nombre de vidéos est calculé.
+    """
     daily_base = Path("daily")
 
     if not daily_base.exists():
         return {"error": "Aucun répertoire daily trouvé"}
 
-    # Parcourir les répertoires de dates
-    date_dirs = sorted([d for d in daily_base.iterdir() if d.is_dir()], reverse=True)
+    # Parcourir les répertoires de dates (scandir : type déjà connu, pas de stat)
+    # nlargest : seuls les 10 derniers jours sont triés, pas tout l'historique
+    with os.scandir(daily_base) as it:
+        date_dirs = heapq.nlargest(
+            STATUS_DAYS, (e for e in it if e.is_dir()), key=lambda e: e.name
+        )
 
     if not date_dirs:
         return {"error": "Aucun répertoire de date trouvé"}
 
     daily_stats = {}
 
-    for date_dir in date_dirs[:10]:  # 10 derniers jours
+    for date_dir in date_dirs:  # 10 derniers jours
         date_name = date_dir.name
 
+        # Un seul parcours du répertoire : synthèses + JSON + résumé
+        synthesis_files = []
+        processed_entry = None
+        summary_entry = None
+        with os.scandir(date_dir.path) as it:
+            for entry in it:
+                name = entry.name
+                if name.startswith("synthese_") and name.endswith(".md"):
+                    synthesis_files.append(name)
+                elif name == "videos_processed.json":
+                    processed_entry = entry
+                elif name == "summary.json":
+                    summary_entry = entry
+
         # Compter les vidéos traitées
-        processed_file = date_dir / "videos_processed.json"
         video_count = 0
         videos_details = []
 
-        if processed_file.exists():
+        if processed_entry is not None:
+            processed_file = Path(processed_entry.path)
             try:
-                with open(processed_file, "r") as f:
-                    data = json.load(f)
+                if include_details:
+                    data = json_loads(processed_file.read_bytes())
                     video_count = len(data.get("video_ids", []))
                     videos_details = data.get("videos", [])
+                elif (
+                    summary_entry is not None
+                    and summary_entry.stat().st_mtime
+                    >= processed_entry.stat().st_mtime
+                ):
+                    # Résumé à jour : pas besoin de lire videos_processed.json
+                    with open(summary_entry.path, "rb") as f:
+                        video_count = json_loads(f.read())["count"]
+                else:
+                    video_count = _count_processed_ids(processed_file)
             except Exception:
                 pass
 
-        # Compter les synthèses
-        synthesis_files = list(date_dir.glob("synthese_*.md"))
-
         daily_stats[date_name] = {
             "videos_count": video_count,
-            "videos_details": videos_details,
             "synthesis_count": len(synthesis_files),
-            "synthesis_files": [f.name for f in synthesis_files],
+            "synthesis_files": synthesis_files,
         }
+        if include_details:
+            daily_stats[date_name]["videos_details"] = videos_details
 
     return daily_stats
 
@@ -188,7 +365,7 @@ def display_daily_status():
     print("📊 Statut des répertoires daily...")
     print("=" * 50)
 
-    stats = get_daily_status()
+    stats = get_daily_status(include_details=False)
 
     if "error" in stats:
         print(f"⚠️ {stats['error']}")
@@ -0,0 +1,39 @@
+"""
+Sérialisation JSON des fichiers de cache et d'état - orjson si disponible
+"""
+
+import os
+
+try:
+    import orjson  # Sérialisation JSON rapide (extension C)
+except ImportError:
+    orjson = None
+    import json
+
+
+def json_loads(data):
+    """Décoder du JSON (bytes ou memoryview)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(bytes(data))
+
+
+def json_dumps(obj):
+    """Encoder en JSON indenté (bytes UTF-8)"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def read_json(path):
+    """Lire et décoder un fichier JSON"""
+    with open(path, "rb") as f:
+        return json_loads(f.read())
+
+
+def write_atomic(path, data):
+    """Écriture atomique : fichier temporaire puis os.replace (str ou Path)"""
+    tmp_file = f"{os.fspath(path)}.tmp"
+    with open(tmp_file, "wb") as f:
+        f.write(data)
+    os.replace(tmp_file, path)
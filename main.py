@@ -16,11 +16,24 @@ Architecture démontrée :
 - CLI complète : Interface utilisateur intuitive
 """
 
+import asyncio
+import copy
+import logging
+import os
+import sys
 import yaml
 import argparse
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    from yaml import CSafeLoader as YamlLoader  # Parser C (libyaml)
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
 
 # TUTORIEL: Imports des modules du projet
-from veille_crew import VeilleCrew  # Classe principale avec decorators CrewAI
+# VeilleCrew (et donc crewai) est importé à la demande dans process_date_videos_async :
+# --list-topics / --status-daily / --test-rss ne paient pas ce coût d'import
 from youtube_processor import (
     collect_videos_for_topic,
     test_rss_feeds,
@@ -31,15 +44,44 @@ from daily_manager import (  # Gestion persistence quotidienne
     group_videos_by_date,
     save_synthesis_by_date,
     mark_videos_as_processed,
+    flush_processed_videos,
     display_daily_status,
 )
 
+# Nombre maximum de topics traités en parallèle (settings.topic_parallelism)
+MAX_TOPIC_WORKERS = 4
+
+# Nombre maximum d'équipes d'agents (une par date) actives par topic
+# (settings.crew_concurrency)
+MAX_CREW_CONCURRENCY = 3
+
+# Cache LRU des fichiers YAML : chemin -> (mtime, taille, contenu parsé)
+_YAML_CACHE = OrderedDict()
+_YAML_CACHE_MAX = 100
+
 
 def load_config(config_file="config/topics.yaml"):
-    """Charger la configuration des topics"""
+    """Charger la configuration des topics
+
+    Le résultat est mis en cache, invalidé si la date de modification ou la
+    taille du fichier change. Une copie est renvoyée : l'appelant peut la modifier.
+    """
     try:
-        with open(config_file, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f)
+        st = os.stat(config_file)
+        key = os.path.abspath(config_file)
+        cached = _YAML_CACHE.get(key)
+        if cached and cached[0] == st.st_mtime and cached[1] == st.st_size:
+            _YAML_CACHE.move_to_end(key)
+            return copy.deepcopy(cached[2])
+
+        with open(config_file, "rb") as f:
+            config = yaml.load(f.read(), Loader=YamlLoader)
+
+        _YAML_CACHE[key] = (st.st_mtime, st.st_size, config)
+        _YAML_CACHE.move_to_end(key)
+        if len(_YAML_CACHE) > _YAML_CACHE_MAX:
+            _YAML_CACHE.popitem(last=False)
+        return copy.deepcopy(config)
     except FileNotFoundError:
         print(f"❌ Fichier {config_file} non trouvé")
         return None
@@ -48,7 +90,7 @@ def load_config(config_file="config/topics.yaml"):
         return None
 
 
-def run_veille_for_topic(topic):
+def run_veille_for_topic(topic, crew_concurrency=MAX_CREW_CONCURRENCY):
     """
     TUTORIEL: Pipeline principal de traitement d'un topic
 
@@ -58,7 +100,7 @@ def run_veille_for_topic(topic):
     3. Organisation par date (daily/)
     4. Traitement par VeilleCrew (agents IA)
     """
-    print(f"\n🚀 Traitement du topic : {topic['name']}")
+    print(f"\n🚀 Traitement du topic : {topic['name']}", flush=True)
 
     # TUTORIEL: Étape 1 - Collecte des données externes
     # youtube_processor récupère 15 jours de vidéos via flux RSS natifs
@@ -77,18 +119,15 @@ def run_veille_for_topic(topic):
     videos_by_date = group_videos_by_date(new_videos)
     print(f"📅 Vidéos réparties sur {len(videos_by_date)} jour(s)")
 
-    processed_syntheses = []
-
     # TUTORIEL: Traitement séparé par date - Pattern important
     # Permet de créer des synthèses historiques cohérentes
-    for pub_date, date_videos in sorted(videos_by_date.items(), reverse=True):
-        print(f"\n📆 Traitement des vidéos du {pub_date} ({len(date_videos)} vidéos)")
-
-        # TUTORIEL: Délégation au système d'agents CrewAI
-        synthesis_file = process_date_videos(topic, pub_date, date_videos)
+    # Les dates sont indépendantes : leurs équipes d'agents tournent en parallèle
+    # (kickoff_async), au plus crew_concurrency à la fois
+    results = asyncio.run(process_dates_async(topic, videos_by_date, crew_concurrency))
+    processed_syntheses = [synthesis for synthesis in results if synthesis]
 
-        if synthesis_file:
-            processed_syntheses.append(synthesis_file)
+    # TUTORIEL: Les vidéos marquées restent en mémoire ; une écriture par date ici
+    flush_processed_videos()
 
     print(
         f"\n🎉 Traitement terminé : {len(processed_syntheses)} synthèse(s) générée(s)"
@@ -96,7 +135,46 @@ def run_veille_for_topic(topic):
     return processed_syntheses
 
 
-def process_date_videos(topic, pub_date, date_videos):
+def format_videos_context(pub_date, date_videos):
+    """Construire le contexte texte des vidéos d'une date pour les agents"""
+    # list.append + "".join : concaténation linéaire, sans copie à chaque ajout
+    parts = [f"\n\nVIDÉOS YOUTUBE DU {pub_date} :\n"]
+    for i, video in enumerate(date_videos, 1):
+        parts.append(f"{i}. **{video.title}** ({video.channel})\n")
+        parts.append(f"   URL: {video.url}\n")
+        parts.append(f"   Publié: {video.published}\n")
+        description = video.description
+        if description:
+            parts.append(f"   Description: {description[:100]}...\n")
+        parts.append("\n")
+    return "".join(parts)
+
+
+async def process_dates_async(topic, videos_by_date, crew_concurrency):
+    """
+    TUTORIEL: Lancer les équipes d'agents de plusieurs dates en parallèle
+
+    Un sémaphore borne le nombre d'équipes actives : elles partagent toutes
+    le même endpoint LLM et ses limites de débit.
+    """
+    semaphore = asyncio.Semaphore(max(1, crew_concurrency))
+
+    async def run_date(pub_date, date_videos):
+        async with semaphore:
+            print(
+                f"\n📆 Traitement des vidéos du {pub_date} ({len(date_videos)} vidéos)"
+            )
+            # TUTORIEL: Délégation au système d'agents CrewAI
+            return await process_date_videos_async(topic, pub_date, date_videos)
+
+    # group_videos_by_date() renvoie les dates de la plus récente à la plus ancienne ;
+    # gather() conserve cet ordre dans les résultats
+    return await asyncio.gather(
+        *(run_date(pub_date, videos) for pub_date, videos in videos_by_date.items())
+    )
+
+
+async def process_date_videos_async(topic, pub_date, date_videos):
     """
     TUTORIEL: Traitement par équipe d'agents CrewAI
 
@@ -105,29 +183,29 @@ def process_date_videos(topic, pub_date, date_videos):
     """
     # TUTORIEL: Préparation du contexte pour les agents IA
     # Les agents ont besoin de connaître les vidéos à analyser
-    videos_context = f"\n\nVIDÉOS YOUTUBE DU {pub_date} :\n"
-    for i, video in enumerate(date_videos, 1):
-        videos_context += f"{i}. **{video['title']}** ({video['channel']})\n"
-        videos_context += f"   URL: {video['url']}\n"
-        videos_context += f"   Publié: {video['published']}\n"
-        if video["description"]:
-            videos_context += f"   Description: {video['description'][:100]}...\n"
-        videos_context += "\n"
+    videos_context = format_videos_context(pub_date, date_videos)
 
     try:
+        from veille_crew import VeilleCrew  # Classe principale avec decorators CrewAI
+
         print(f"⚡ Lancement VeilleCrew pour {pub_date}...")
 
         # TUTORIEL: Instanciation et lancement de l'équipe d'agents
         # VeilleCrew.create_for_topic() utilise le pattern Factory
         crew_instance = VeilleCrew.create_for_topic(topic, videos_context, pub_date)
 
-        # TUTORIEL: kickoff_for_topic() démarre l'exécution séquentielle
+        # TUTORIEL: kickoff_for_topic_async() démarre l'exécution séquentielle
+        # des tâches sans bloquer la boucle asyncio (les autres dates avancent)
+        # Le contexte est déjà fourni par create_for_topic() : pas de re-préparation
         # 1. Agent researcher → cherche articles avec Serper
         # 2. Agent synthesizer → crée synthèse avec articles + vidéos
-        result = crew_instance.kickoff_for_topic(topic, videos_context, pub_date)
+        result = await crew_instance.kickoff_for_topic_async()
 
         # TUTORIEL: Persistence du résultat dans l'organisation daily/
-        synthesis_file = save_synthesis_by_date(str(result), topic["name"], pub_date)
+        # Le répertoire a déjà été créé par filter_new_videos (video.daily_dir)
+        synthesis_file = save_synthesis_by_date(
+            str(result), topic["name"], pub_date, date_videos[0].daily_dir
+        )
 
         # TUTORIEL: Marquage anti-doublons pour éviter retraitement
         mark_videos_as_processed(date_videos)
@@ -146,6 +224,16 @@ def main():
     Cette fonction montre comment créer une interface utilisateur
     pour un système CrewAI avec différents modes de fonctionnement.
     """
+    # TUTORIEL: Messages de la collecte RSS (threads) affichés comme des print.
+    # Seul le logger du projet est configuré : le logger racine (et donc les
+    # bibliothèques comme crewai ou LiteLLM) reste inchangé
+    rss_log = logging.getLogger("youtube_processor")
+    rss_handler = logging.StreamHandler(sys.stdout)
+    rss_handler.setFormatter(logging.Formatter("%(message)s"))
+    rss_log.addHandler(rss_handler)
+    rss_log.setLevel(logging.INFO)
+    rss_log.propagate = False
+
     # TUTORIEL: Configuration CLI avec argparse
     parser = argparse.ArgumentParser(
         description="Veille CrewAI Simple - Tutoriel complet"
@@ -228,13 +316,31 @@ def main():
 
     # TUTORIEL: Traitement de chaque topic avec CrewAI
     # Chaque topic génère potentiellement plusieurs synthèses (une par date de publication)
+    # TUTORIEL: Les topics sont indépendants et le travail est dominé par le réseau
+    # (RSS, LLM) : un pool de threads les traite en parallèle
+    # run_veille_for_topic() orchestrera les agents IA pour chaque topic
+    # Parallélisme réglable dans topics.yaml : tous les topics partagent le même
+    # endpoint LLM, au-delà de ses quotas les appels se mettent simplement en file
+    settings = config.get("settings", {})
+    topic_parallelism = settings.get("topic_parallelism", MAX_TOPIC_WORKERS)
+    crew_concurrency = settings.get("crew_concurrency", MAX_CREW_CONCURRENCY)
+    max_workers = max(1, min(topic_parallelism, len(topics_to_process)))
     results = []
-    for topic in topics_to_process:
-        # TUTORIEL: run_veille_for_topic() orchestrera les agents IA
-        # pour ce topic spécifique en utilisant VeilleCrew
-        filename = run_veille_for_topic(topic)
-        if filename:
-            results.append(filename)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(run_veille_for_topic, topic, crew_concurrency): topic
+            for topic in topics_to_process
+        }
+        for future in as_completed(futures):
+            topic = futures[future]
+            # Une erreur sur un topic n'interrompt pas les autres
+            try:
+                syntheses = future.result()
+            except Exception as e:
+                print(f"❌ Erreur topic {topic['name']} : {e}")
+                continue
+            if syntheses:
+                results.extend(syntheses)
 
     # Résumé
     print("\n🎉 Traitement terminé !")
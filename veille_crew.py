@@ -8,6 +8,8 @@ Il montre comment structurer une équipe d'agents IA pour l'analyse d'actualité
 # Imports CrewAI - Framework d'orchestration d'agents IA
 from crewai import Agent, Crew, Task, Process, LLM
 import os
+from datetime import date
+from functools import lru_cache
 
 # Decorators modernes CrewAI 2025 - permettent l'auto-découverte des composants
 from crewai.project import CrewBase, agent, task, crew, tool
@@ -18,6 +20,24 @@ from crewai_tools import SerperDevTool
 # Module custom pour traitement YouTube
 from youtube_processor import collect_videos_for_topic
 
+@lru_cache(maxsize=64)
+def format_french_date(day):
+    """Formater une date en JJ/MM/AAAA (mémoïsé : quelques dates par exécution)"""
+    return f"{day.day:02d}/{day.month:02d}/{day.year:04d}"
+
+
+# TUTORIEL: Instance unique de l'outil de recherche, partagée par toutes les
+# équipes (une VeilleCrew est créée par date) - l'outil est sans état
+_SEARCH_TOOL = None
+
+
+def _get_search_tool():
+    """Retourner l'instance partagée de SerperDevTool (créée au premier appel)"""
+    global _SEARCH_TOOL
+    if _SEARCH_TOOL is None:
+        _SEARCH_TOOL = SerperDevTool()
+    return _SEARCH_TOOL
+
 
 # TUTORIEL: @CrewBase est le decorator principal qui marque une classe comme "équipe d'agents"
 # Il active l'auto-découverte : tous les @agent/@task/@tool sont automatiquement collectés
@@ -68,10 +88,8 @@ class VeilleCrew:
         if not self.topic_config:
             return {}
 
-        from datetime import datetime
-
         # Utiliser la date de publication ou aujourd'hui
-        target_date = self.pub_date if self.pub_date else datetime.now().date()
+        target_date = self.pub_date if self.pub_date else date.today()
 
         # TUTORIEL: Ces variables seront disponibles dans tasks.yaml via {topic_name}, etc.
         return {
@@ -87,7 +105,7 @@ class VeilleCrew:
             "volume": self.topic_config.get(
                 "volume", 10
             ),  # Nombre de résultats souhaités
-            "date": target_date.strftime("%d/%m/%Y"),  # Date formatée française
+            "date": format_french_date(target_date),  # Date formatée française
             "videos_context": self.videos_context,  # Contexte vidéos pré-récupéré
         }
 
@@ -123,8 +141,9 @@ class VeilleCrew:
 
         Cet outil permet aux agents de rechercher des articles sur Google.
         SerperDevTool est un outil pré-construit fourni par crewai-tools.
+        L'instance est partagée entre toutes les exécutions (voir _get_search_tool).
         """
-        return SerperDevTool()
+        return _get_search_tool()
 
     # TUTORIEL: Exemple d'outil custom - Vous pouvez créer vos propres outils
     @tool
@@ -151,10 +170,12 @@ class VeilleCrew:
                 if hasattr(self, "_topic_config") and self._topic_config:
                     videos = collect_videos_for_topic(self._topic_config)
                     if videos:
-                        result = f"Vidéos YouTube récentes pour {topic_name}:\n"
-                        for video in videos[:5]:
-                            result += f"- {video['title']} ({video['channel']})\n"
-                        return result
+                        lines = [f"Vidéos YouTube récentes pour {topic_name}:\n"]
+                        lines.extend(
+                            f"- {video.title} ({video.channel})\n"
+                            for video in videos[:5]
+                        )
+                        return "".join(lines)
                 return f"Aucune vidéo récente trouvée pour {topic_name}"
 
         return YouTubeRSSTool()
@@ -211,21 +232,11 @@ class VeilleCrew:
         TUTORIEL: Première tâche - Recherche d'articles
 
         Cette tâche demande à l'agent researcher de chercher des actualités.
-        La description vient de tasks.yaml et est formatée avec les variables du topic.
+        La description vient de tasks.yaml : ses placeholders {topic_name}, {keywords}...
+        sont remplacés par CrewAI au lancement (kickoff avec inputs=self.variables).
         """
-        task_config = self.tasks_config[
-            "search_articles"
-        ].copy()  # Configuration depuis tasks.yaml
-
-        # TUTORIEL: Injection de variables dans la description
-        # Remplace {topic_name}, {keywords}, etc. par les vraies valeurs
-        if self.variables:
-            task_config["description"] = task_config["description"].format(
-                **self.variables
-            )
-
         return Task(
-            config=task_config,  # Description et expected_output depuis YAML
+            config=self.tasks_config["search_articles"],  # Depuis tasks.yaml
             agent=self.researcher(),  # Agent assigné à cette tâche
         )
 
@@ -238,23 +249,9 @@ class VeilleCrew:
         Cette tâche prend les articles trouvés par le researcher et les vidéos YouTube
         pré-collectées pour créer une synthèse complète en markdown.
         """
-        task_config = self.tasks_config[
-            "synthesize"
-        ].copy()  # Configuration depuis tasks.yaml
-
-        # TUTORIEL: Formatage dynamique avec contexte vidéos
-        if self.variables:
-            description = task_config["description"].format(**self.variables)
-
-            # TUTORIEL: Ajout du contexte vidéos YouTube directement dans la description
-            # Les vidéos ont été pré-collectées par youtube_processor
-            if self.videos_context:
-                description += self.videos_context
-
-            task_config["description"] = description
-
+        # TUTORIEL: Le contexte vidéos est injecté via le placeholder {videos_context}
         return Task(
-            config=task_config,  # Description enrichie + expected_output
+            config=self.tasks_config["synthesize"],  # Description + expected_output
             agent=self.synthesizer(),  # Agent spécialisé en rédaction
         )
 
@@ -292,7 +289,18 @@ class VeilleCrew:
         self.variables = self._prepare_task_variables()  # Re-calcul des variables
 
         # TUTORIEL: Démarrage de l'équipe - kickoff() lance l'exécution
-        return self.crew().kickoff()
+        # inputs : CrewAI remplace les placeholders des tâches au lancement
+        return self.crew().kickoff(inputs=self.variables or None)
+
+    async def kickoff_for_topic_async(self):
+        """
+        TUTORIEL: Variante asynchrone, avec le contexte du constructeur
+
+        Crew.kickoff_async() exécute l'équipe sans bloquer la boucle asyncio :
+        plusieurs équipes (une par date) peuvent ainsi avancer en parallèle.
+        Le contexte (topic, vidéos, date) est celui passé à create_for_topic().
+        """
+        return await self.crew().kickoff_async(inputs=self.variables or None)
 
     @classmethod
     def create_for_topic(cls, topic_config, videos_context="", pub_date=None):
@@ -2,61 +2,301 @@
 Module de traitement YouTube - RSS feeds et résolution Channel IDs
 """
 
-import subprocess
-import feedparser
-import json
+import atexit
+import heapq
+import logging
 import os
-from datetime import datetime, timedelta
+import re
+import requests
+import threading
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from io import BytesIO
+from itertools import chain
+from operator import attrgetter
+from pathlib import Path
+from json_utils import json_dumps, read_json, write_atomic
+
+# Parser XML : lxml si disponible, sinon ElementTree (bibliothèque standard)
+try:
+    from lxml import etree
+except ImportError:
+    import xml.etree.ElementTree as etree
+
+# Messages émis depuis les threads de collecte : passent par logging (main
+# configure l'affichage) plutôt que par print, au niveau près filtrable.
+# NullHandler : silencieux par défaut quand le module est importé ailleurs
+_log = logging.getLogger(__name__)
+_log.addHandler(logging.NullHandler())
 
 # Cache simple pour éviter de récupérer les IDs à chaque fois
 CHANNEL_ID_CACHE_FILE = "channel_ids_cache.json"
 
+# Les topics peuvent être traités en parallèle : protéger le fichier cache
+_cache_lock = threading.Lock()
+
+# Contenu du cache en mémoire (chargé au premier accès)
+_channel_id_cache = None
+
+# Nouveaux IDs pas encore écrits sur disque (voir flush_channel_id_cache)
+_channel_id_cache_dirty = False
+
+# Cache des flux RSS : corps du dernier flux + validateurs HTTP (ETag, Last-Modified)
+# pour des requêtes conditionnelles (304 Not Modified = ni téléchargement ni parsing)
+RSS_CACHE_DIR = "rss_cache"
+RSS_VALIDATORS_FILE = os.path.join(RSS_CACHE_DIR, "validators.json")
+RSS_CACHE_MAX_FEEDS = 512
+_rss_cache_lock = threading.Lock()
+_rss_validators = None
+_rss_validators_dirty = False  # Ordre LRU modifié par des 304, pas encore écrit
+
+# Fenêtre de collecte par défaut : 15 jours
+DEFAULT_HOURS_LIMIT = 360
+
+# Nombre maximum de flux RSS récupérés en parallèle
+MAX_RSS_WORKERS = 16
+
+# Session HTTP partagée (keep-alive : connexions TCP/TLS réutilisées)
+# Pool dimensionné sur MAX_RSS_WORKERS : chaque thread garde sa connexion
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(pool_connections=MAX_RSS_WORKERS, pool_maxsize=MAX_RSS_WORKERS),
+)
+atexit.register(_SESSION.close)  # Fermer proprement les connexions en fin de run
+
+# Espaces de noms du flux Atom YouTube (schéma fixe)
+_ATOM = "{http://www.w3.org/2005/Atom}"
+_YT = "{http://www.youtube.com/xml/schemas/2015}"
+_MEDIA = "{http://search.yahoo.com/mrss/}"
+
+# Nom de chaîne dans le chemin d'une URL YouTube (handle, /c/, /channel/
+# ou dernier segment) - appliqué après retrait de la query et du fragment
+_CHANNEL_NAME_RE = re.compile(r"(?:@|/c/|/channel/)([^/]+)|([^/]+)/?$")
+
+# ID de chaîne dans le HTML d'une page YouTube : balise <link rel="canonical">
+# (dans le <head>, donc trouvée tôt) ou, à défaut, les clés JSON embarquées
+_CHANNEL_ID_RE = re.compile(
+    rb'(?:rel="canonical"[^>]*?href="[^"]*/channel/'
+    rb'|"(?:channelId|externalId|ownerChannelId)":")'
+    rb"(UC[-_0-9A-Za-z]{22})"
+)
+
+
+@dataclass(slots=True)
+class Video:
+    """Vidéo YouTube récente issue d'un flux RSS"""
+
+    title: str
+    url: str
+    published: str  # Date ISO 8601 telle que fournie par le flux
+    channel: str
+    description: str
+    published_date: datetime  # Date de publication (UTC)
+    published_ts: float  # Même date en secondes epoch (tris et comparaisons)
+    pub_date: date  # Jour de publication (répertoire daily/)
+    video_id: str = ""
+    channel_name: str = ""
+    daily_dir: Path | None = None  # Renseigné par daily_manager.filter_new_videos
+
 
 def load_channel_id_cache():
-    """Charger le cache des Channel IDs"""
-    if os.path.exists(CHANNEL_ID_CACHE_FILE):
-        try:
-            with open(CHANNEL_ID_CACHE_FILE, 'r') as f:
-                return json.load(f)
-        except:
-            pass
-    return {}
+    """Charger le cache des Channel IDs (lu une seule fois par processus)"""
+    global _channel_id_cache
+    with _cache_lock:
+        if _channel_id_cache is None:
+            _channel_id_cache = {}
+            if os.path.exists(CHANNEL_ID_CACHE_FILE):
+                try:
+                    _channel_id_cache = read_json(CHANNEL_ID_CACHE_FILE)
+                except (OSError, ValueError):
+                    pass
+        return _channel_id_cache
+
 
 def save_channel_id_cache(cache):
-    """Sauvegarder le cache des Channel IDs"""
+    """Sauvegarder le cache des Channel IDs (écriture atomique)"""
+    with _cache_lock:
+        _write_channel_id_cache(cache)
+
+
+def _write_channel_id_cache(cache):
+    """Écrire le cache via un fichier temporaire (verrou tenu)"""
     try:
-        with open(CHANNEL_ID_CACHE_FILE, 'w') as f:
-            json.dump(cache, f, indent=2)
+        write_atomic(CHANNEL_ID_CACHE_FILE, json_dumps(cache))
     except Exception as e:
-        print(f"⚠️ Erreur sauvegarde cache : {e}")
+        _log.warning("⚠️ Erreur sauvegarde cache : %s", e)
+
+
+def _remember_channel_id(channel_url, channel_id):
+    """Ajouter un ID au cache en mémoire (écrit par flush_channel_id_cache)"""
+    global _channel_id_cache_dirty
+    cache = load_channel_id_cache()
+    with _cache_lock:
+        cache[channel_url] = channel_id
+        _channel_id_cache_dirty = True
+
+
+def flush_channel_id_cache():
+    """Écrire le cache sur disque s'il a reçu de nouveaux IDs"""
+    global _channel_id_cache_dirty
+    with _cache_lock:
+        if _channel_id_cache_dirty:
+            _write_channel_id_cache(_channel_id_cache)
+            _channel_id_cache_dirty = False
+
+
+# Filet de sécurité : les IDs résolus hors collecte sont écrits en fin de run
+atexit.register(flush_channel_id_cache)
+
+
+def _load_rss_validators():
+    """Charger les validateurs HTTP des flux RSS (verrou tenu)"""
+    global _rss_validators
+    if _rss_validators is None:
+        _rss_validators = {}
+        if os.path.exists(RSS_VALIDATORS_FILE):
+            try:
+                _rss_validators = read_json(RSS_VALIDATORS_FILE)
+            except (OSError, ValueError):
+                pass
+    return _rss_validators
+
+
+def _touch_rss_feed(channel_id):
+    """Passer une chaîne en fin d'ordre LRU (flux inchangé mais utilisé)"""
+    global _rss_validators_dirty
+    with _rss_cache_lock:
+        validators = _load_rss_validators()
+        entry = validators.pop(channel_id, None)
+        if entry is not None:
+            validators[channel_id] = entry
+            _rss_validators_dirty = True
+
+
+def flush_rss_validators():
+    """Écrire les validateurs RSS si l'ordre LRU a changé depuis la dernière écriture"""
+    global _rss_validators_dirty
+    with _rss_cache_lock:
+        if not _rss_validators_dirty:
+            return
+        try:
+            write_atomic(RSS_VALIDATORS_FILE, json_dumps(_rss_validators))
+            _rss_validators_dirty = False
+        except Exception as e:
+            _log.warning("⚠️ Erreur sauvegarde cache RSS : %s", e)
+
+
+atexit.register(flush_rss_validators)
+
+
+def fetch_rss_feed(channel_id):
+    """
+    Télécharger le flux RSS d'une chaîne avec une requête conditionnelle
+
+    Si YouTube répond 304 (flux inchangé), le corps mis en cache est réutilisé.
+    """
+    global _rss_validators_dirty
+    rss_url = f"https://www.youtube.com/feeds/videos.xml?channel_id={channel_id}"
+    body_file = os.path.join(RSS_CACHE_DIR, f"{channel_id}.xml")
+
+    with _rss_cache_lock:
+        previous = _load_rss_validators().get(channel_id, {})
+
+    headers = {}
+    if previous and os.path.exists(body_file):
+        if previous.get("etag"):
+            headers["If-None-Match"] = previous["etag"]
+        if previous.get("modified"):
+            headers["If-Modified-Since"] = previous["modified"]
 
+    response = _SESSION.get(rss_url, headers=headers, timeout=10)
+
+    if response.status_code == 304:
+        try:
+            with open(body_file, "rb") as f:
+                content = f.read()
+        except FileNotFoundError:
+            # Corps supprimé entre-temps (éviction, nettoyage manuel) :
+            # nouvelle requête, sans validateurs, pour obtenir le flux complet
+            response = _SESSION.get(rss_url, timeout=10)
+        else:
+            _touch_rss_feed(channel_id)  # Flux utilisé : ne pas l'évincer en premier
+            return content
+
+    response.raise_for_status()
+    content = response.content
+
+    etag = response.headers.get("ETag")
+    modified = response.headers.get("Last-Modified")
+    if etag or modified:
+        try:
+            with _rss_cache_lock:
+                os.makedirs(RSS_CACHE_DIR, exist_ok=True)
+                write_atomic(body_file, content)
+                validators = _load_rss_validators()
+                # Ordre d'insertion = ordre LRU : la chaîne passe en fin de liste
+                validators.pop(channel_id, None)
+                validators[channel_id] = {"etag": etag, "modified": modified}
+                while len(validators) > RSS_CACHE_MAX_FEEDS:
+                    oldest_id = next(iter(validators))
+                    del validators[oldest_id]
+                    try:
+                        os.remove(os.path.join(RSS_CACHE_DIR, f"{oldest_id}.xml"))
+                    except FileNotFoundError:
+                        pass
+                write_atomic(RSS_VALIDATORS_FILE, json_dumps(validators))
+                _rss_validators_dirty = False  # Ordre LRU courant écrit
+        except Exception as e:
+            _log.warning("⚠️ Erreur sauvegarde cache RSS : %s", e)
+
+    return content
+
+
+@lru_cache(maxsize=256)
 def extract_channel_name(url):
     """Extraire le nom de la chaîne depuis l'URL YouTube"""
-    try:
-        if "@" in url:
-            # Format: https://www.youtube.com/@Underscore_
-            return url.split("@")[-1]
-        elif "/c/" in url:
-            # Format: https://www.youtube.com/c/Micode
-            return url.split("/c/")[-1]
-        elif "/channel/" in url:
-            # Format: https://www.youtube.com/channel/UCxxx
-            return url.split("/channel/")[-1]
-        else:
-            # Fallback: prendre la dernière partie après /
-            return url.split("/")[-1]
-    except (IndexError, AttributeError):
+    # Formats : .../@Underscore_, .../c/Micode, .../channel/UCxxx
+    # ou, à défaut, le dernier segment du chemin
+    path = url.partition("?")[0].partition("#")[0]  # Sans ?query ni #fragment
+    match = _CHANNEL_NAME_RE.search(path)
+    if not match:
         return url  # Retourner l'URL si extraction échoue
+    return match.group(1) or match.group(2)
+
+
+def _find_channel_id_in_page(channel_url):
+    """Chercher le premier ID de chaîne (UC...) dans la page, lue en flux"""
+    with _SESSION.get(channel_url, stream=True, timeout=10) as response:
+        response.raise_for_status()
+        tail = b""
+        for chunk in response.iter_content(65536):
+            # Garder la fin du bloc précédent : un ID peut être coupé en deux
+            buffer = tail + chunk
+            match = _CHANNEL_ID_RE.search(buffer)
+            if match:
+                return match.group(1).decode("ascii")
+            tail = buffer[-256:]
+    return None
 
 
 def get_channel_id_from_url(channel_url):
-    """Obtenir l'ID de la chaîne depuis son URL YouTube avec cache"""
-    # Charger le cache
+    """Obtenir l'ID de la chaîne depuis son URL YouTube avec cache
+
+    Le cache en mémoire (chargé une fois, alimenté par _remember_channel_id)
+    ne retient que les résolutions réussies : une chaîne suivie par plusieurs
+    topics n'est résolue qu'une fois par exécution, mais un échec temporaire
+    (réseau, timeout) est retenté au prochain appel.
+    """
+    # Charger le cache (dict en mémoire après le premier appel)
     cache = load_channel_id_cache()
     
     # Vérifier si déjà en cache
     if channel_url in cache:
-        print(f"📋 ID trouvé en cache pour {extract_channel_name(channel_url)}")
+        _log.debug("📋 ID trouvé en cache pour %s", channel_url)
         return cache[channel_url]
     
     try:
@@ -68,36 +308,67 @@ def get_channel_id_from_url(channel_url):
         if "/channel/" in channel_url:
             channel_id = channel_url.split("/channel/")[-1].split("?")[0]
             # Sauvegarder en cache
-            cache[channel_url] = channel_id
-            save_channel_id_cache(cache)
+            _remember_channel_id(channel_url, channel_id)
             return channel_id
 
-        # Utiliser la méthode curl/grep qui fonctionne parfaitement
-        print(f"🔍 Recherche ID pour {extract_channel_name(channel_url)}...")
-        cmd = f'''curl -sL "{channel_url}" | grep -oE '("channelId"|"externalId"|"ownerChannelId"):"UC[-_0-9A-Za-z]{{22}}' | head -n1 | grep -oE 'UC[-_0-9A-Za-z]{{22}}' '''
-
-        result = subprocess.run(
-            cmd, shell=True, capture_output=True, text=True, timeout=30
-        )
+        # Télécharger la page en flux et s'arrêter au premier ID trouvé
+        _log.info("🔍 Recherche ID pour %s...", extract_channel_name(channel_url))
+        channel_id = _find_channel_id_in_page(channel_url)
 
-        if result.returncode == 0 and result.stdout.strip():
-            channel_id = result.stdout.strip()
-            if channel_id.startswith("UC") and len(channel_id) == 24:
-                # Sauvegarder en cache
-                cache[channel_url] = channel_id
-                save_channel_id_cache(cache)
-                print(f"✅ ID trouvé et mis en cache : {channel_id}")
-                return channel_id
+        if channel_id:
+            # Sauvegarder en cache
+            _remember_channel_id(channel_url, channel_id)
+            _log.info("✅ ID trouvé et mis en cache : %s", channel_id)
+            return channel_id
 
-        print(f"⚠️ Impossible de trouver l'ID pour {channel_url}")
+        _log.warning("⚠️ Impossible de trouver l'ID pour %s", channel_url)
         return None
 
     except Exception as e:
-        print(f"❌ Erreur extraction ID chaîne {channel_url}: {e}")
+        _log.error("❌ Erreur extraction ID chaîne %s: %s", channel_url, e)
         return None
 
 
-def get_recent_videos_from_rss(channel_url, hours_limit=360):
+def parse_youtube_feed(xml_bytes):
+    """
+    Extraire titre de chaîne et entrées d'un flux Atom YouTube
+
+    Le schéma YouTube est fixe : lecture directe des quelques champs utiles,
+    sans les heuristiques génériques d'un parser RSS/Atom complet.
+    Le parsing est incrémental (iterparse) : les entrées sont produites une à
+    une et l'appelant peut arrêter la lecture dès la date limite atteinte.
+    """
+    events = etree.iterparse(BytesIO(xml_bytes), events=("start", "end"))
+
+    # Le <title> de la chaîne précède la première <entry>
+    feed_title = None
+    for event, elem in events:
+        if event == "start" and elem.tag == f"{_ATOM}entry":
+            break
+        if event == "end" and elem.tag == f"{_ATOM}title":
+            feed_title = elem.text
+
+    return feed_title, _iter_feed_entries(events)
+
+
+def _iter_feed_entries(events):
+    """Produire les champs de chaque <entry> à la fin de sa lecture"""
+    for event, elem in events:
+        if event != "end" or elem.tag != f"{_ATOM}entry":
+            continue
+
+        link = elem.find(f"{_ATOM}link")
+        yield {
+            "title": elem.findtext(f"{_ATOM}title", ""),
+            "link": link.get("href", "") if link is not None else "",
+            "published": elem.findtext(f"{_ATOM}published", ""),
+            "video_id": elem.findtext(f"{_YT}videoId"),
+            "summary": elem.findtext(f"{_MEDIA}group/{_MEDIA}description", ""),
+        }
+        elem.clear()  # Libérer les sous-éléments déjà exploités
+
+
+def get_recent_videos_from_rss(channel_url, hours_limit=DEFAULT_HOURS_LIMIT):
     """Récupérer les vidéos récentes via RSS feed YouTube (15 jours par défaut)"""
     try:
         # Obtenir l'ID de la chaîne
@@ -105,91 +376,154 @@ def get_recent_videos_from_rss(channel_url, hours_limit=360):
         if not channel_id:
             return []
 
-        # Construire l'URL du flux RSS
-        rss_url = f"https://www.youtube.com/feeds/videos.xml?channel_id={channel_id}"
+        # Télécharger (requête conditionnelle) et parser le flux RSS
+        feed_title, entries = parse_youtube_feed(fetch_rss_feed(channel_id))
 
-        # Parser le flux RSS
-        feed = feedparser.parse(rss_url)
-
-        if not feed.entries:
-            print(f"⚠️ Aucune vidéo trouvée dans le flux RSS pour {channel_url}")
+        first_entry = next(entries, None)
+        if first_entry is None:
+            _log.warning(
+                "⚠️ Aucune vidéo trouvée dans le flux RSS pour %s", channel_url
+            )
             return []
+        entries = chain([first_entry], entries)
 
-        # Filtrer par date (dernières X heures)
-        cutoff_time = datetime.now() - timedelta(hours=hours_limit)
+        # Filtrer par date (dernières X heures) - comparaison en secondes epoch
+        cutoff_ts = (
+            datetime.now(timezone.utc) - timedelta(hours=hours_limit)
+        ).timestamp()
+        channel = feed_title if feed_title else extract_channel_name(channel_url)
         recent_videos = []
 
-        for entry in feed.entries:
+        for entry in entries:
+            # Garde-fou peu coûteux : une entrée sans date est ignorée
+            published = entry["published"]
+            if not published:
+                continue
+
+            # Seule étape pouvant réellement échouer (date mal formée)
             try:
-                # Parser la date de publication
-                pub_date = datetime(*entry.published_parsed[:6])
-
-                # Garder seulement les vidéos récentes
-                if pub_date > cutoff_time:
-                    video = {
-                        "title": entry.title,
-                        "url": entry.link,
-                        "published": entry.published,
-                        "channel": feed.feed.title
-                        if hasattr(feed.feed, "title")
-                        else extract_channel_name(channel_url),
-                        "description": getattr(entry, "summary", ""),
-                        "published_date": pub_date,
-                    }
-                    recent_videos.append(video)
-
-            except Exception as e:
-                print(f"⚠️ Erreur parsing vidéo : {e}")
+                # Parser la date de publication (ISO 8601, avec fuseau)
+                pub_dt = datetime.fromisoformat(published)
+            except ValueError as e:
+                _log.warning("⚠️ Erreur parsing vidéo : %s", e)
                 continue
+            pub_ts = pub_dt.timestamp()
+
+            # Le flux YouTube est trié du plus récent au plus ancien :
+            # la première vidéo trop ancienne termine le parcours, et la liste
+            # retournée reste dans cet ordre (attendu par heapq.merge)
+            if pub_ts <= cutoff_ts:
+                break
+
+            pub_date = pub_dt.astimezone(timezone.utc)
+
+            # Garder seulement les vidéos récentes
+            video = Video(
+                title=entry["title"],
+                url=entry["link"],
+                published=published,
+                channel=channel,
+                description=entry["summary"],
+                published_date=pub_date,
+                published_ts=pub_ts,
+                # Calculés une fois ici, réutilisés par daily_manager
+                pub_date=pub_date.date(),
+                video_id=entry["video_id"] or get_video_id_from_url(entry["link"]),
+            )
+            recent_videos.append(video)
 
-        # Trier par date (plus récent en premier)
-        recent_videos.sort(key=lambda x: x["published_date"], reverse=True)
         return recent_videos
 
     except Exception as e:
-        print(f"❌ Erreur RSS pour {channel_url} : {e}")
+        _log.error("❌ Erreur RSS pour %s : %s", channel_url, e)
         return []
 
 
+@lru_cache(maxsize=4096)
 def get_video_id_from_url(video_url):
     """Extraire l'ID de vidéo depuis une URL YouTube"""
     try:
-        return video_url.split("watch?v=")[-1].split("&")[0]
-    except (IndexError, AttributeError):
+        # partition : pas de liste intermédiaire (rpartition = dernière occurrence,
+        # URL entière si "watch?v=" est absent, comme split()[-1])
+        return video_url.rpartition("watch?v=")[2].partition("&")[0]
+    except AttributeError:
         return ""
 
 
-def collect_videos_for_topic(topic, verbose=True):
-    """Collecter toutes les vidéos YouTube pour un topic via RSS"""
+def fetch_channels_videos(channel_urls, hours_limit=DEFAULT_HOURS_LIMIT):
+    """Récupérer en parallèle les vidéos récentes de chaque chaîne (URL → vidéos)"""
+    # dict.fromkeys : dédoublonne en conservant l'ordre, chaque flux n'est lu qu'une fois
+    unique_urls = list(dict.fromkeys(channel_urls))
+    if not unique_urls:
+        return {}
+
+    # Temps dominé par le réseau : les flux sont récupérés en parallèle
+    max_workers = min(MAX_RSS_WORKERS, len(unique_urls))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(
+            lambda url: get_recent_videos_from_rss(url, hours_limit=hours_limit),
+            unique_urls,
+        )
+        videos_by_channel = dict(zip(unique_urls, results))
+
+    # Une seule écriture des caches pour toute la collecte (IDs résolus, ordre LRU)
+    flush_channel_id_cache()
+    flush_rss_validators()
+    return videos_by_channel
+
+
+def collect_videos_for_topic(
+    topic, verbose=True, videos_by_channel=None, *, hours_limit=DEFAULT_HOURS_LIMIT
+):
+    """Collecter toutes les vidéos YouTube pour un topic via RSS
+
+    videos_by_channel permet de fournir des flux déjà récupérés
+    (voir fetch_channels_videos) au lieu de les relire.
+    """
     all_videos = []
+    days, hours = divmod(hours_limit, 24)
+    if hours:
+        window = f"{hours_limit} h"
+    else:
+        window = f"{days} jour{'s' if days > 1 else ''}"
 
     if verbose:
-        print(f"📡 Récupération RSS pour {topic['name']} (15 derniers jours)...")
+        print(f"📡 Récupération RSS pour {topic['name']} (fenêtre de {window})...")
+
+    channel_urls = topic["youtube_channels"]
+    if not channel_urls:
+        return all_videos
+
+    if videos_by_channel is None:
+        videos_by_channel = fetch_channels_videos(channel_urls, hours_limit)
 
-    for channel_url in topic["youtube_channels"]:
+    # Les résultats sont traités ici, dans l'ordre des chaînes
+    channel_lists = []
+    for channel_url in channel_urls:
+        videos = videos_by_channel.get(channel_url)
         channel_name = extract_channel_name(channel_url)
 
         if verbose:
             print(f"  📺 Analyse de {channel_name}...")
 
-        videos = get_recent_videos_from_rss(channel_url, hours_limit=360)
-
         if videos:
             if verbose:
-                print(f"    📊 {len(videos)} vidéo(s) trouvée(s) sur 15 jours")
+                print(f"    📊 {len(videos)} vidéo(s) trouvée(s) sur {window}")
 
             # Ajouter les métadonnées pour le traitement
             for video in videos:
-                video["video_id"] = get_video_id_from_url(video["url"])
-                video["channel_name"] = channel_name
+                video.channel_name = channel_name
 
-            all_videos.extend(videos)
+            channel_lists.append(videos)
         else:
             if verbose:
                 print("    ⚠️ Aucune vidéo trouvée")
 
-    # Trier par date de publication (plus récent en premier)
-    all_videos.sort(key=lambda x: x["published_date"], reverse=True)
+    # Chaque liste est déjà triée (plus récent en premier) : fusion k-voies
+    # au lieu d'un tri global de la concaténation
+    all_videos.extend(
+        heapq.merge(*channel_lists, key=attrgetter("published_ts"), reverse=True)
+    )
     return all_videos
 
 
@@ -198,16 +532,24 @@ def test_rss_feeds(topics):
     print("🧪 Test des flux RSS YouTube...")
     print("=" * 50)
 
+    # Toutes les chaînes de tous les topics sont récupérées en une seule vague :
+    # une chaîne partagée entre plusieurs topics n'est lue qu'une fois
+    videos_by_channel = fetch_channels_videos(
+        url for topic in topics for url in topic["youtube_channels"]
+    )
+
     for topic in topics:
         print(f"\n📺 Topic : {topic['name']}")
-        videos = collect_videos_for_topic(topic, verbose=True)
+        videos = collect_videos_for_topic(
+            topic, verbose=True, videos_by_channel=videos_by_channel
+        )
 
         if videos:
             print(f"✅ {len(videos)} vidéo(s) récente(s) :")
             for video in videos[:3]:  # Afficher les 3 premières
-                print(f"  • {video['title']}")
-                print(f"    Chaîne: {video['channel']} | Publié: {video['published']}")
-                print(f"    URL: {video['url']}")
+                print(f"  • {video.title}")
+                print(f"    Chaîne: {video.channel} | Publié: {video.published}")
+                print(f"    URL: {video.url}")
                 print()
         else:
             print("⚠️ Aucune vidéo récente trouvée")